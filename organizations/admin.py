@@ -1,13 +1,14 @@
 from django.contrib import admin
 from django import forms
+from django.core.exceptions import ValidationError
 from .models import (
     Organization, OrganizationUser, StrategicObjective, 
     Program, StrategicInitiative, PerformanceMeasure, MainActivity,
     ActivityBudget, ActivityCostingAssumption, InitiativeFeed,
     Location, LandTransport, AirTransport, PerDiem, Accommodation,
-    ParticipantCost, SessionCost, PrintingCost, SupervisorCost,ProcurementItem,Plan
+    ParticipantCost, SessionCost, PrintingCost, SupervisorCost,ProcurementItem,Plan,
+    PlanSelectedObjective
 )
-admin.site.register(Plan)
 class OrganizationAdminForm(forms.ModelForm):
     core_values_text = forms.CharField(
         widget=forms.Textarea(attrs={'rows': 5}),
@@ -22,16 +23,21 @@ class OrganizationAdminForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Convert JSON list to newline-separated text for editing
-        if self.instance.pk and self.instance.core_values:
-            self.fields['core_values_text'].initial = '\n'.join(self.instance.core_values)
+        # Convert JSON list to newline-separated text for editing; cache the
+        # joined text on the instance so repeated form renders reuse it
+        if self.instance.pk and self.instance.core_values_list:
+            if not hasattr(self.instance, '_core_values_text'):
+                self.instance._core_values_text = '\n'.join(self.instance.core_values_list)
+            self.fields['core_values_text'].initial = self.instance._core_values_text
 
     def clean(self):
         cleaned_data = super().clean()
         # Convert newline-separated text back to list for JSON field
         core_values_text = cleaned_data.get('core_values_text', '')
         if core_values_text:
-            cleaned_data['core_values'] = [value.strip() for value in core_values_text.split('\n') if value.strip()]
+            cleaned_data['core_values'] = [
+                value for line in core_values_text.splitlines() if (value := line.strip())
+            ]
         else:
             cleaned_data['core_values'] = []
         return cleaned_data
@@ -40,6 +46,7 @@ class OrganizationAdminForm(forms.ModelForm):
 class OrganizationAdmin(admin.ModelAdmin):
     form = OrganizationAdminForm
     list_display = ('name', 'type', 'parent', 'created_at', 'updated_at')
+    list_select_related = ('parent',)
     list_filter = ('type',)
     search_fields = ('name',)
     ordering = ('type', 'name')
@@ -60,7 +67,8 @@ class OrganizationAdmin(admin.ModelAdmin):
 @admin.register(OrganizationUser)
 class OrganizationUserAdmin(admin.ModelAdmin):
     list_display = ('user', 'organization', 'role', 'created_at')
-    list_filter = ('role', 'organization')
+    list_select_related = ('user', 'organization')
+    list_filter = ('role', ('organization', admin.RelatedOnlyFieldListFilter))
     search_fields = ('user__username', 'user__email', 'organization__name')
     ordering = ('organization', 'user')
 
@@ -68,7 +76,7 @@ class OrganizationUserAdmin(admin.ModelAdmin):
 class InitiativeFeedAdmin(admin.ModelAdmin):
     list_display = ('name', 'strategic_objective', 'is_active', 'created_at', 'updated_at')
     search_fields = ('name', 'description', 'strategic_objective__title')
-    list_filter = ('is_active', 'strategic_objective')
+    list_filter = ('is_active', ('strategic_objective', admin.RelatedOnlyFieldListFilter))
     ordering = ('name',)
     fieldsets = (
         (None, {
@@ -80,36 +88,70 @@ class InitiativeFeedAdmin(admin.ModelAdmin):
 class StrategicObjectiveAdmin(admin.ModelAdmin):
     list_display = ('title', 'weight', 'is_default', 'created_at', 'updated_at')
     list_filter = ('is_default',)
-    search_fields = ('title', 'description')
+    search_fields = ('^title', 'description')
 
 @admin.register(Program)
 class ProgramAdmin(admin.ModelAdmin):
     list_display = ('name', 'strategic_objective', 'is_default', 'created_at', 'updated_at')
-    list_filter = ('strategic_objective', 'is_default')
+    list_filter = (('strategic_objective', admin.RelatedOnlyFieldListFilter), 'is_default')
     search_fields = ('name', 'description')
+    autocomplete_fields = ('strategic_objective',)
 
 class PerformanceMeasureInline(admin.TabularInline):
     model = PerformanceMeasure
     extra = 1
     fields = ('name', 'weight', 'baseline', 'q1_target', 'q2_target', 'q3_target', 'q4_target', 'annual_target')
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('initiative')
+
 class MainActivityInline(admin.TabularInline):
     model = MainActivity
     extra = 1
     fields = ('name', 'weight', 'selected_months', 'selected_quarters', 'baseline', 'target_type', 'q1_target', 'q2_target', 'q3_target', 'q4_target', 'annual_target')
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('initiative')
+
 @admin.register(StrategicInitiative)
 class StrategicInitiativeAdmin(admin.ModelAdmin):
     list_display = ('name', 'strategic_objective', 'program', 'weight', 'is_default', 'created_at', 'updated_at')
-    list_filter = ('strategic_objective', 'program', 'is_default')
-    search_fields = ('name',)
+    list_select_related = ('strategic_objective', 'program')
+    list_filter = (
+        ('strategic_objective', admin.RelatedOnlyFieldListFilter),
+        ('program', admin.RelatedOnlyFieldListFilter),
+        'is_default',
+    )
+    search_fields = ('^name',)
+    autocomplete_fields = ('strategic_objective', 'program')
     inlines = [PerformanceMeasureInline, MainActivityInline]
 
+    def get_queryset(self, request):
+        # Fetch only the columns the changelist actually renders
+        return super().get_queryset(request).select_related('strategic_objective', 'program').only(
+            'name', 'weight', 'is_default', 'created_at', 'updated_at',
+            'strategic_objective__title', 'program__name'
+        )
+
+    def get_object(self, request, object_id, from_field=None):
+        # The change form needs every field; lift the changelist-only
+        # column restriction before fetching the single object
+        queryset = self.get_queryset(request).defer(None)
+        model = queryset.model
+        field = model._meta.pk if from_field is None else model._meta.get_field(from_field)
+        try:
+            object_id = field.to_python(object_id)
+            return queryset.get(**{field.name: object_id})
+        except (model.DoesNotExist, ValidationError, ValueError):
+            return None
+
 @admin.register(PerformanceMeasure)
 class PerformanceMeasureAdmin(admin.ModelAdmin):
     list_display = ('name', 'initiative', 'weight', 'annual_target', 'created_at', 'updated_at')
-    list_filter = ('initiative',)
-    search_fields = ('name',)
+    list_select_related = ('initiative',)
+    list_filter = (('initiative', admin.RelatedOnlyFieldListFilter),)
+    search_fields = ('^name',)
+    autocomplete_fields = ('initiative',)
     fieldsets = (
         (None, {
             'fields': ('initiative', 'name', 'weight', 'baseline')
@@ -126,8 +168,10 @@ class PerformanceMeasureAdmin(admin.ModelAdmin):
 @admin.register(MainActivity)
 class MainActivityAdmin(admin.ModelAdmin):
     list_display = ('name', 'initiative', 'weight', 'created_at', 'updated_at')
-    list_filter = ('initiative',)
-    search_fields = ('name',)
+    list_select_related = ('initiative',)
+    list_filter = (('initiative', admin.RelatedOnlyFieldListFilter),)
+    search_fields = ('^name',)
+    autocomplete_fields = ('initiative',)
     fieldsets = (
         (None, {
             'fields': ('initiative', 'name', 'weight')
@@ -143,8 +187,10 @@ class MainActivityAdmin(admin.ModelAdmin):
 @admin.register(ActivityBudget)
 class ActivityBudgetAdmin(admin.ModelAdmin):
     list_display = ('activity', 'budget_calculation_type', 'activity_type', 'created_at')
+    list_select_related = ('activity',)
     list_filter = ('budget_calculation_type', 'activity_type')
     search_fields = ('activity__name',)
+    autocomplete_fields = ('activity',)
     fieldsets = (
         (None, {
             'fields': ('activity', 'budget_calculation_type', 'activity_type')
@@ -184,15 +230,11 @@ class LocationAdmin(admin.ModelAdmin):
             'fields': ('name', 'region', 'is_hardship_area')
         }),
     )
-    
-    def formfield_for_choice_field(self, db_field, request, **kwargs):
-        if db_field.name == 'region':
-            kwargs['choices'] = Location.REGIONS
-        return super().formfield_for_choice_field(db_field, request, **kwargs)
 
 @admin.register(LandTransport)
 class LandTransportAdmin(admin.ModelAdmin):
     list_display = ('origin', 'destination', 'trip_type', 'price')
+    list_select_related = ('origin', 'destination')
     list_filter = ('trip_type', 'origin__region', 'destination__region')
     search_fields = ('origin__name', 'destination__name')
     ordering = ('origin', 'destination')
@@ -200,6 +242,7 @@ class LandTransportAdmin(admin.ModelAdmin):
 @admin.register(AirTransport)
 class AirTransportAdmin(admin.ModelAdmin):
     list_display = ('origin', 'destination', 'price')
+    list_select_related = ('origin', 'destination')
     list_filter = ('origin__region', 'destination__region')
     search_fields = ('origin__name', 'destination__name')
     ordering = ('origin', 'destination')
@@ -207,6 +250,7 @@ class AirTransportAdmin(admin.ModelAdmin):
 @admin.register(PerDiem)
 class PerDiemAdmin(admin.ModelAdmin):
     list_display = ('location', 'amount', 'hardship_allowance_amount')
+    list_select_related = ('location',)
     list_filter = ('location__region',)
     search_fields = ('location__name',)
     ordering = ('location', 'amount')
@@ -214,6 +258,7 @@ class PerDiemAdmin(admin.ModelAdmin):
 @admin.register(Accommodation)
 class AccommodationAdmin(admin.ModelAdmin):
     list_display = ('location', 'service_type', 'price')
+    list_select_related = ('location',)
     list_filter = ('service_type', 'location__region')
     search_fields = ('location__name',)
     ordering = ('location', 'service_type')
@@ -241,6 +286,23 @@ class SupervisorCostAdmin(admin.ModelAdmin):
     list_display = ('cost_type', 'amount')
     list_filter = ('cost_type',)
     ordering = ('cost_type',)
+class PlanSelectedObjectiveInline(admin.TabularInline):
+    model = PlanSelectedObjective
+    extra = 1
+    autocomplete_fields = ('objective',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('objective')
+
+@admin.register(Plan)
+class PlanAdmin(admin.ModelAdmin):
+    list_display = ('organization', 'strategic_objective', 'type', 'fiscal_year', 'status', 'submitted_at')
+    list_select_related = ('organization', 'strategic_objective')
+    list_filter = ('status', 'type')
+    search_fields = ('organization__name', 'planner_name')
+    autocomplete_fields = ('organization', 'strategic_objective', 'program')
+    inlines = [PlanSelectedObjectiveInline]
+
 @admin.register(ProcurementItem)
 class ProcurementItemAdmin(admin.ModelAdmin):
     list_display = ('name', 'category', 'unit', 'unit_price')
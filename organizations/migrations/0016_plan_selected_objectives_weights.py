@@ -13,5 +13,4 @@ class Migration(migrations.Migration):
             name='selected_objectives_weights',
             field=models.JSONField(blank=True, help_text='Custom weights assigned by planner for each selected objective {objective_id: weight}', null=True),
         ),
-    ]
-</anoltAction>
\ No newline at end of file
+    ]
\ No newline at end of file
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.10 on 2026-08-27 21:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0016_plan_selected_objectives_weights'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accommodation',
+            index=models.Index(fields=['location', 'service_type'], name='accom_loc_service_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='airtransport',
+            index=models.Index(fields=['origin', 'destination'], name='airtrans_orig_dest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='landtransport',
+            index=models.Index(fields=['origin', 'destination'], name='landtrans_orig_dest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['region', 'name'], name='location_region_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(fields=['type', 'name'], name='organization_type_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organizationuser',
+            index=models.Index(fields=['organization', 'user'], name='orguser_org_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='perdiem',
+            index=models.Index(fields=['location', 'amount'], name='perdiem_loc_amount_idx'),
+        ),
+    ]
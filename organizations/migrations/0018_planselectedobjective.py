@@ -0,0 +1,59 @@
+# Generated by Django 4.2.10 on 2026-08-27 22:00
+
+from decimal import Decimal
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def copy_selected_objectives(apps, schema_editor):
+    """
+    Expand each plan's selected_objectives M2M rows plus its
+    selected_objectives_weights JSON dict into PlanSelectedObjective rows.
+    """
+    Plan = apps.get_model('organizations', 'Plan')
+    PlanSelectedObjective = apps.get_model('organizations', 'PlanSelectedObjective')
+
+    links = []
+    for plan in Plan.objects.all():
+        weights = plan.selected_objectives_weights or {}
+        for objective_id in plan.selected_objectives.values_list('id', flat=True):
+            weight = weights.get(str(objective_id), weights.get(objective_id))
+            links.append(PlanSelectedObjective(
+                plan_id=plan.id,
+                objective_id=objective_id,
+                weight=Decimal(str(weight)) if weight is not None else None,
+            ))
+    PlanSelectedObjective.objects.bulk_create(links)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0017_admin_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlanSelectedObjective',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weight', models.DecimalField(blank=True, decimal_places=2, help_text="Planner's custom weight for this objective in this plan", max_digits=5, null=True)),
+                ('objective', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='plan_selections', to='organizations.strategicobjective')),
+                ('plan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='selected_objective_links', to='organizations.plan')),
+            ],
+            options={
+                'unique_together': {('plan', 'objective')},
+            },
+        ),
+        migrations.RunPython(copy_selected_objectives, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='plan',
+            name='selected_objectives',
+        ),
+        migrations.AddField(
+            model_name='plan',
+            name='selected_objectives',
+            field=models.ManyToManyField(blank=True, help_text='All objectives selected for this plan', related_name='selected_in_plans', through='organizations.PlanSelectedObjective', to='organizations.strategicobjective'),
+        ),
+    ]
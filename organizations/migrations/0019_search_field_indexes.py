@@ -0,0 +1,33 @@
+# Generated by Django 4.2.10 on 2026-08-27 22:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0018_planselectedobjective'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='mainactivity',
+            name='name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='performancemeasure',
+            name='name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='strategicinitiative',
+            name='name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='strategicobjective',
+            name='title',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
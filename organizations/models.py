@@ -2,6 +2,7 @@ from django.db import models
 from django.core.exceptions import ValidationError
 from decimal import Decimal
 from django.utils import timezone
+from django.utils.functional import cached_property
 
 def validate_positive_weight(value):
     if value <= 0:
@@ -36,7 +37,18 @@ class Organization(models.Model):
     core_values = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['type', 'name'], name='organization_type_name_idx'),
+        ]
+
+    @cached_property
+    def core_values_list(self):
+        """Decoded core values list, cached so repeated reads on the same
+        instance don't re-decode the JSON field."""
+        return self.core_values or []
+
     def __str__(self):
         return self.name
 
@@ -54,13 +66,16 @@ class OrganizationUser(models.Model):
     
     class Meta:
         unique_together = ('user', 'organization', 'role')
+        indexes = [
+            models.Index(fields=['organization', 'user'], name='orguser_org_user_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.organization.name} ({self.role})"
 
 
 class StrategicObjective(models.Model):
-    title = models.CharField(max_length=255)
+    title = models.CharField(max_length=255, db_index=True)
     description = models.TextField(null=True, blank=True)
     weight = models.DecimalField(
         max_digits=5,
@@ -144,7 +159,7 @@ class InitiativeFeed(models.Model):
 
 
 class StrategicInitiative(models.Model):
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
     weight = models.DecimalField(max_digits=5, decimal_places=2)
     strategic_objective = models.ForeignKey(
         StrategicObjective,
@@ -269,7 +284,7 @@ class PerformanceMeasure(models.Model):
         on_delete=models.CASCADE,
         related_name='performance_measures'
     )
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
     weight = models.DecimalField(max_digits=5, decimal_places=2)
     baseline = models.CharField(max_length=255, default="", blank=True)
     target_type = models.CharField(
@@ -417,7 +432,7 @@ class MainActivity(models.Model):
         on_delete=models.CASCADE,
         related_name='main_activities'
     )
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
     weight = models.DecimalField(max_digits=5, decimal_places=2)
     baseline = models.CharField(max_length=255, default="", blank=True)
     target_type = models.CharField(
@@ -761,7 +776,12 @@ class Location(models.Model):
     is_hardship_area = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['region', 'name'], name='location_region_name_idx'),
+        ]
+
     def __str__(self):
         return f"{self.name}, {self.region}"
 
@@ -780,7 +800,12 @@ class LandTransport(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['origin', 'destination'], name='landtrans_orig_dest_idx'),
+        ]
+
     def __str__(self):
         trip = "Round Trip" if self.trip_type == 'ROUND' else "Single Trip"
         return f"{self.origin} to {self.destination} ({trip}): {self.price}"
@@ -794,7 +819,12 @@ class AirTransport(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['origin', 'destination'], name='airtrans_orig_dest_idx'),
+        ]
+
     def __str__(self):
         return f"{self.origin} to {self.destination}: {self.price}"
 
@@ -807,7 +837,12 @@ class PerDiem(models.Model):
     hardship_allowance_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['location', 'amount'], name='perdiem_loc_amount_idx'),
+        ]
+
     def __str__(self):
         return f"Per Diem for {self.location}: {self.amount}"
 
@@ -828,7 +863,12 @@ class Accommodation(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['location', 'service_type'], name='accom_loc_service_idx'),
+        ]
+
     def __str__(self):
         return f"{self.service_type} at {self.location}: {self.price}"
 
@@ -983,6 +1023,7 @@ class Plan(models.Model):
     # Add many-to-many field to store all selected objectives
     selected_objectives = models.ManyToManyField(
         StrategicObjective,
+        through='PlanSelectedObjective',
         related_name='selected_in_plans',
         blank=True,
         help_text="All objectives selected for this plan"
@@ -1014,6 +1055,17 @@ class Plan(models.Model):
     
     def __str__(self):
         return f"{self.organization.name} - {self.strategic_objective} - {self.fiscal_year}"
+
+    def get_total_selected_weight(self):
+        """Return the sum of the planner's weights for the selected objectives.
+
+        Aggregated in SQL over the PlanSelectedObjective through table, so no
+        JSON decoding of selected_objectives_weights is needed to get the total.
+        """
+        total = self.selected_objective_links.aggregate(
+            total=models.Sum('weight')
+        )['total']
+        return total if total is not None else Decimal('0')
         
     # Method to clean the plan data and prevent duplicate submissions
     def clean(self):
@@ -1049,6 +1101,37 @@ class Plan(models.Model):
         self.clean()
         super().save(*args, **kwargs)
 
+class PlanSelectedObjective(models.Model):
+    """
+    Through model linking a plan to its selected objectives.
+    Stores the planner's custom weight per objective as a real column so a
+    single weight can be read (or summed in SQL) without decoding the whole
+    selected_objectives_weights JSON blob.
+    """
+    plan = models.ForeignKey(
+        Plan,
+        on_delete=models.CASCADE,
+        related_name='selected_objective_links'
+    )
+    objective = models.ForeignKey(
+        StrategicObjective,
+        on_delete=models.CASCADE,
+        related_name='plan_selections'
+    )
+    weight = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        help_text="Planner's custom weight for this objective in this plan"
+    )
+
+    class Meta:
+        unique_together = ('plan', 'objective')
+
+    def __str__(self):
+        return f"{self.plan_id} - {self.objective}: {self.weight}"
+
 class PlanReview(models.Model):
     REVIEW_STATUS = [
         ('APPROVED', 'Approved'),